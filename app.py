@@ -1,20 +1,18 @@
 import streamlit as st
 import requests
 import pronouncing
-import math
 import random
 import re
-import plotly.graph_objects as go
+import pandas as pd
 from gtts import gTTS
-import tempfile
-import base64
 from google.cloud import translate_v2 as translate
 from google.oauth2 import service_account
-import epitran
-from indic_transliteration.sanscript import transliterate
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import hashlib
-import io
+from google.auth.transport.requests import AuthorizedSession
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout, as_completed
+from functools import lru_cache
+from itertools import chain, permutations, zip_longest
+import zlib
 
 # ------------------------
 # Page & Animated CSS UI
@@ -240,52 +238,122 @@ st.markdown(
 st.markdown('<div style="text-align:center;"><div class="main-header">🎛️ Melosphere — Polyglot Lyric Blending</div><div class="sub-header">Rhythmic translation & polyglot blending — enhanced UI</div></div>', unsafe_allow_html=True)
 
 # ------------------------
-# Logging (sidebar) - NO LOGIC CHANGE
+# Logging (sidebar)
 # ------------------------
-if "melosphere_logs" not in st.session_state:
-    st.session_state["melosphere_logs"] = ""
+# Only the most recent lines are kept, so a long session doesn't grow the log (and its sidebar text_area) forever
+# (isinstance rather than "not in": a session that survives a redeploy may still hold the old str log)
+if not isinstance(st.session_state.get("melosphere_logs"), deque):
+    st.session_state["melosphere_logs"] = deque(maxlen=200)
 
 def log(msg: str):
-    st.session_state["melosphere_logs"] += msg + "\n"
+    st.session_state["melosphere_logs"].append(msg)
+
+def log_text():
+    return "\n".join(st.session_state.get("melosphere_logs", ()))
 
 # ------------------------
-# Google Cloud Translate Setup - NO LOGIC CHANGE
+# Google Cloud Translate Setup
 # ------------------------
+# Worker threads in the shared pool; every HTTP connection pool is sized to match, so concurrent calls
+# from a full pool reuse kept-alive connections instead of opening and discarding extra ones
+_IO_WORKERS = 16
+
 @st.cache_resource
 def get_translate_client():
     try:
         credentials_info = st.secrets["gcp_service_account"]
-        credentials = service_account.Credentials.from_service_account_info(credentials_info)
-        client = translate.Client(credentials=credentials)
+        # Scoped here because a caller-supplied _http is used as-is: the client only scopes its own copy
+        credentials = service_account.Credentials.from_service_account_info(credentials_info).with_scopes(translate.Client.SCOPE)
+        # Build the HTTP session up front: the client's lazy session is not thread-safe, so the first
+        # parallel translations could each open their own TLS connection. One pooled session is shared.
+        http = AuthorizedSession(credentials)
+        http.mount("https://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=_IO_WORKERS))
+        client = translate.Client(credentials=credentials, _http=http)
         log("✅ Translate client initialized")
         return client
     except Exception as e:
         log(f"❌ Translate init error: {e}")
         return None
 
-translate_client = get_translate_client()
+# Cached on (text, target_lang) only; errors raise, so a failed call is retried on the next rerun.
+# persist="disk" keeps translations across app restarts. Streamlit ignores ttl for persisted caches, and
+# max_entries only bounds the in-memory layer: the disk store is never evicted (`streamlit cache clear` empties it).
+# The same holds for the persisted rhyme cache below.
+@st.cache_data(persist="disk", max_entries=512, show_spinner=False)
+def _translate_cached(text, target_lang):
+    result = get_translate_client().translate(text, target_language=target_lang, source_language="en")
+    return result.get("translatedText", "")
 
 def translate_text(text, target_lang):
-    if not translate_client:
-        return "⚠️ Translation client not initialized. Check your credentials in Streamlit secrets."
+    # Returns (translation, error) and never logs: it runs on pool workers, where session state is unreachable
+    # Nothing to send: blank input, or the target is the (English) source language
+    if not text.strip():
+        return "", None
+    if target_lang == "en":
+        return text, None
+    if not get_translate_client():
+        return "⚠️ Translation client not initialized. Check your credentials in Streamlit secrets.", "client not initialized"
     try:
-        result = translate_client.translate(text, target_language=target_lang)
-        return result.get("translatedText", "")
+        return _translate_cached(text, target_lang), None
     except Exception as e:
-        log(f"⚠️ Translation error for {target_lang}: {e}")
-        return f"Error during translation: {e}"
+        return f"Error during translation: {e}", e
+
+@st.cache_resource
+def _get_executor():
+    # One long-lived pool shared by every rerun and session, instead of spawning threads per widget change.
+    # Pool tasks never wait on other pool tasks, so sharing it can't deadlock; it is never shut down.
+    return ThreadPoolExecutor(max_workers=_IO_WORKERS, thread_name_prefix="melosphere-io")
+
+_TRANSLATE_TIMEOUT = 15
+
+def iter_translations_parallel(text, target_langs):
+    # One request per target language, fanned out so k languages cost ~1 round-trip instead of k.
+    # Yields (code, translation, failed) in completion order so the caller can render each one as it lands;
+    # a failed translation carries its error text, which must not be spoken or transliterated.
+    if not target_langs:
+        return
+    executor = _get_executor()
+    # One request per distinct code
+    futures = {executor.submit(translate_text, text, code): code for code in dict.fromkeys(target_langs)}
+    done = set()
+    try:
+        for fut in as_completed(futures, timeout=_TRANSLATE_TIMEOUT):
+            done.add(fut)
+            code = futures[fut]
+            try:
+                translation, err = fut.result()
+            except Exception as e:
+                # Anything translate_text didn't catch still becomes one error card, not a failed page
+                translation, err = f"Error during translation: {e}", e
+            if err is not None:
+                # The generator is consumed on the script thread, so logging here reaches this session
+                log(f"⚠️ Translation error for {code}: {err}")
+            yield code, translation, err is not None
+    except FuturesTimeout:
+        # The client's own HTTP timeout is 60s; stop waiting sooner and let the stragglers finish on the pool
+        for fut, code in futures.items():
+            if fut not in done:
+                log(f"Translation timed out for {code} after {_TRANSLATE_TIMEOUT}s")
+                yield code, f"Error during translation: timed out after {_TRANSLATE_TIMEOUT}s", True
 
 # ------------------------
-# Rhymes & Syllable helpers - NO LOGIC CHANGE
+# Rhymes & Syllable helpers
 # ------------------------
+_HTTP = requests.Session()
+_HTTP.mount("https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=_IO_WORKERS, max_retries=1))
+
+# Persisted to disk; network failures raise out of the cached function so an outage is never stored as "no rhymes"
+@st.cache_data(persist="disk", max_entries=1024, show_spinner=False)
+def _lookup_rhymes(word):
+    response = _HTTP.get(f'https://api.datamuse.com/words?rel_rhy={word}&max=10', timeout=3)
+    response.raise_for_status()
+    return [item['word'] for item in response.json()]
+
 def get_rhymes(word):
     try:
-        response = requests.get(f'https://api.datamuse.com/words?rel_rhy={word}&max=10', timeout=6)
-        if response.status_code == 200:
-            return [item['word'] for item in response.json()]
+        return _lookup_rhymes(word.lower())
     except Exception:
-        pass
-    return []
+        return []
 
 def clean_text(text):
     if text is None:
@@ -296,34 +364,38 @@ def clean_text(text):
     return t
 
 def count_syllables_english(word):
+    # CMU lookups are case-insensitive, so "Love"/"love"/"LOVE" share one cache entry
+    return _english_word_syllables(word.lower())
+
+_ASCII_VOWEL_RE = re.compile(r"[aeiou]")
+
+@lru_cache(maxsize=8192)
+def _english_word_syllables(word):
     phones = pronouncing.phones_for_word(word)
     if phones:
         try:
             return pronouncing.syllable_count(phones[0])
         except Exception:
-            return sum(1 for ch in word.lower() if ch in 'aeiou')
-    return sum(1 for ch in word.lower() if ch in 'aeiou')
+            return len(_ASCII_VOWEL_RE.findall(word))
+    return len(_ASCII_VOWEL_RE.findall(word))
 
+_PUNCT_RE = re.compile(r"[,.!?;:\-—()\"']")
+
+@lru_cache(maxsize=256)
 def count_syllables_heuristic(text):
-    text = str(text)
-    for ch in ",.!?;:-—()\"'":
-        text = text.replace(ch, " ")
-    words = [w for w in text.split() if w.strip()]
-    syllables = 0
-    for w in words:
-        lw = w.lower()
-        groups = 0
-        prev_vowel = False
-        for ch in lw:
-            is_v = ch in "aeiouáàâäãåāéèêëēíìîïīóòôöõōúùûüūy"
-            if is_v and not prev_vowel:
-                groups += 1
-            prev_vowel = is_v
-        if groups == 0:
-            groups = 1
-        syllables += groups
-    return syllables
+    # One substitution pass instead of a str.replace per punctuation mark
+    text = _PUNCT_RE.sub(" ", str(text))
+    return sum(_heuristic_word_syllables(w.lower()) for w in text.split())
+
+_VOWEL_GROUP_RE = re.compile(r"[aeiouáàâäãåāéèêëēíìîïīóòôöõōúùûüūy]+")
 
+@lru_cache(maxsize=8192)
+def _heuristic_word_syllables(lw):
+    # Each maximal run of vowels is one syllable; the scan runs inside the C regex engine
+    return len(_VOWEL_GROUP_RE.findall(lw)) or 1
+
+# Pure function of two strings, and called with the same arguments several times per rerun
+@lru_cache(maxsize=2048)
 def count_syllables_general(text, lang_code):
     if not text or not isinstance(text, str):
         return 0
@@ -334,130 +406,125 @@ def count_syllables_general(text, lang_code):
         return count_syllables_heuristic(text)
 
 # ------------------------
-# Smart filler insertion (deterministic) - NO LOGIC CHANGE
+# Smart filler insertion (deterministic)
 # ------------------------
-_FILLERS = ["oh", "la", "yeah", "na", "hey", "mmm"]
+# Every filler is one syllable, so k fillers always add exactly k syllables
+_FILLERS = ("oh", "la", "yeah", "na", "hey", "mmm")
+# Every ordered pick of k distinct fillers for the k the app actually uses (6 + 30 + 120 strings)
+_FILLER_TABLES = {k: [" ".join(p) for p in permutations(_FILLERS, k)] for k in (1, 2, 3)}
 
 def _build_fillers(diff, max_fillers=3, seed_text=None):
     fillers = _FILLERS
     k = min(max_fillers, max(0, diff))
     if k == 0:
-        return ""
+        return "", 0
     seed = 0
     if seed_text is not None:
-        seed = int(hashlib.sha256(seed_text.encode("utf-8")).hexdigest()[:16], 16)
+        # Only needs to be stable across runs (hash() is salted per process), not cryptographic
+        seed = zlib.crc32(seed_text.encode("utf-8"))
+    table = _FILLER_TABLES.get(k)
+    if table is not None:
+        return table[seed % len(table)], k
     rnd = random.Random(seed)
-    if k <= len(fillers):
-        chosen = rnd.sample(fillers, k)
-    else:
-        chosen = [rnd.choice(fillers) for _ in range(k)]
-    return " ".join(chosen)
+    chosen = rnd.sample(fillers, k) if k <= len(fillers) else rnd.choices(fillers, k=k)
+    return " ".join(chosen), k
 
 def insert_fillers_safely(translated_text, fillers_str):
     if not fillers_str:
         return translated_text
     t = translated_text.strip()
-    m = re.search(r'([.!?])\s*$', t)
-    if m:
-        base = t[:m.start()].rstrip()
-        punct = m.group(1)
+    # t is already stripped, so a plain suffix check is all the old trailing-punctuation regex did
+    if t.endswith((".", "!", "?")):
+        base = t[:-1].rstrip()
+        punct = t[-1]
         return f"{base}, {fillers_str}{punct}"
-    else:
-        last_comma = t.rfind(',')
-        if last_comma != -1 and last_comma < len(t) - 1:
-            return f"{t}, {fillers_str}"
-        return f"{t}, {fillers_str}"
+    return f"{t}, {fillers_str}"
 
 # ------------------------
-# Rhythmic Translation Enhancement - NO LOGIC CHANGE
+# Rhythmic Translation Enhancement
 # ------------------------
-def rhythmic_translation_enhancement(original, translated, max_fillers=3):
-    orig_syll = count_syllables_general(original, "en")
+def rhythmic_translation_enhancement(original, translated, max_fillers=3, orig_syll=None):
+    if orig_syll is None:
+        orig_syll = count_syllables_general(original, "en")
     trans_syll_before = count_syllables_heuristic(translated)
     diff = orig_syll - trans_syll_before
     if diff <= 0:
         enhanced = translated.strip()
         trans_syll_after = trans_syll_before
     else:
-        fillers_str = _build_fillers(diff, max_fillers=max_fillers, seed_text=translated + original if translated else original)
+        fillers_str, filler_syll = _build_fillers(diff, max_fillers=max_fillers, seed_text=translated + original if translated else original)
         enhanced = insert_fillers_safely(translated, fillers_str)
-        trans_syll_after = count_syllables_heuristic(enhanced)
-    enhanced = re.sub(r"\s+", " ", enhanced).strip()
+        trans_syll_after = trans_syll_before + filler_syll
+    # str.split() with no argument treats the same characters as whitespace as \s does,
+    # so this is the old collapse-and-strip regex without the regex engine
+    enhanced = " ".join(enhanced.split())
     return enhanced, orig_syll, trans_syll_before, trans_syll_after, diff
 
 # ------------------------
-# Blending Strategies - NO LOGIC CHANGE
+# Blending Strategies
 # ------------------------
+def _drop_repeats(tokens):
+    # Skips None padding and any token equal (case-insensitively) to the last one kept; lowercases each token once
+    out = []
+    prev = None
+    for tok in tokens:
+        if tok is None:
+            continue
+        low = tok.lower()
+        if low != prev:
+            out.append(tok)
+            prev = low
+    return out
+
 def interleave_words(original, translations_by_lang):
     tokenized = [t.split() for t in translations_by_lang]
-    max_len = max(len(t) for t in tokenized) if tokenized else 0
-    blended_tokens = []
-    for i in range(max_len):
-        for tok_list in tokenized:
-            if i < len(tok_list):
-                tok = tok_list[i]
-                if blended_tokens and tok.lower() == blended_tokens[-1].lower():
-                    continue
-                blended_tokens.append(tok)
-    return " ".join(blended_tokens)
+    # zip_longest walks the ragged token lists column by column in C; shorter lists pad with None
+    return _drop_repeats(chain.from_iterable(zip_longest(*tokenized)))
 
 def phrase_swap(original, translations_by_lang):
-    segments = []
-    for t in translations_by_lang:
-        words = t.split()
-        seg_size = max(1, math.ceil(len(words) / 2))
-        segments.append(words)
-    if len(segments) == 1:
-        return translations_by_lang[0]
-    if len(segments) == 2:
+    segments = [t.split() for t in translations_by_lang]
+    n_seg = len(segments)
+    if n_seg == 1:
+        return segments[0]
+    if n_seg == 2:
         a, b = segments
-        a_seg = a[:math.ceil(len(a) / 2)]
-        b_seg = b[math.floor(len(b) / 2):]
-        assembled = a_seg + b_seg
-        out = []
-        for w in assembled:
-            if not out or w.lower() != out[-1].lower():
-                out.append(w)
-        return " ".join(out)
+        a_seg = a[:(len(a) + 1) // 2]
+        b_seg = b[len(b) // 2:]
+        return _drop_repeats(a_seg + b_seg)
     assembled = []
     for idx, words in enumerate(segments):
         n = len(words)
-        start = math.floor(idx * n / len(segments))
-        end = math.floor((idx + 1) * n / len(segments))
+        start = idx * n // n_seg
+        end = (idx + 1) * n // n_seg
         if start < end:
             assembled.extend(words[start:end])
         else:
             assembled.extend(words[: max(1, min(3, n))])
-    out = []
-    for w in assembled:
-        if not out or w.lower() != out[-1].lower():
-            out.append(w)
-    return " ".join(out)
+    return _drop_repeats(assembled)
 
 def last_word_swap(original, translations_by_lang):
     orig_words = original.strip().split()
     if not orig_words:
-        return original
+        return orig_words
     for t in translations_by_lang:
         tw = t.strip().split()
         if tw:
             new_last = tw[-1]
             if new_last.lower() == orig_words[-1].lower() and len(tw) > 1:
                 new_last = tw[-2]
-            return " ".join(orig_words[:-1] + [new_last])
-    return original
+            return orig_words[:-1] + [new_last]
+    return orig_words
 
 # ------------------------
-# Utility - NO LOGIC CHANGE
+# Utility
 # ------------------------
-def remove_consecutive_duplicates(text):
-    words = text.split()
-    if not words:
-        return ""
-    out = [words[0]]
-    for w in words[1:]:
-        if w != out[-1]:
-            out.append(w)
+def finalize(tokens):
+    # Drop consecutive duplicates straight from the blend's token list and join once (no join/split round trip)
+    out = []
+    for tok in tokens:
+        if out and tok == out[-1]:
+            continue
+        out.append(tok)
     return " ".join(out)
 
 def syllable_dots(count, cap=40):
@@ -466,122 +533,183 @@ def syllable_dots(count, cap=40):
         dots += f"...(+{count-cap})"
     return dots.strip()
 
-def plot_syllable_comparison(orig_syll, trans_before, trans_after, lang_name):
-    categories = ["Original (en)", f"{lang_name} (clean)", f"{lang_name} (enhanced)"]
-    values = [orig_syll, trans_before, trans_after]
-    colors = []
-    for v in values:
-        diff = abs(v - orig_syll)
-        colors.append("#2ecc71" if diff == 0 else "#f1c40f" if diff <= 2 else "#e74c3c")
-    fig = go.Figure([go.Bar(x=categories, y=values, marker_color=colors, text=values, textposition="auto")])
-    fig.update_layout(
-        title=f"Syllable Count Comparison — {lang_name}",
-        yaxis_title="Syllable count",
-        height=360,
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font_color='#f1f1f1' # Ensure chart title and labels are visible on dark background
+def syllable_comparison_frame(stats_by_lang):
+    # One frame for every language: rows are languages, columns the three counts (grouped in a single st.bar_chart)
+    names = list(stats_by_lang)
+    return pd.DataFrame(
+        {
+            "Original (en)": [stats_by_lang[n]["orig_syll"] for n in names],
+            "Clean": [stats_by_lang[n]["trans_before"] for n in names],
+            "Enhanced": [stats_by_lang[n]["trans_after"] for n in names],
+        },
+        index=names,
     )
-    return fig
 
 # ------------------------
-# Pronunciation helpers - NO LOGIC CHANGE
+# Pronunciation helpers
 # ------------------------
-@st.cache_data(show_spinner=False)
+# Bounded, expiring in-memory cache (not persisted, so clips don't pile up on disk);
+# failures raise instead of returning a placeholder, so they are never cached
+@st.cache_data(ttl=24 * 60 * 60, max_entries=128, show_spinner=False)
 def generate_tts_audio(text, lang_code):
+    # Per-request timeout so a stalled TTS endpoint can't hang the run
+    tts = gTTS(text=text, lang=lang_code, timeout=5)
+    # Collect the decoded mp3 parts straight from gTTS's stream: no tempfile, no BytesIO copy.
+    # Raw mp3 bytes are served by st.audio through Streamlit's media endpoint (no base64 inlining)
+    return b"".join(tts.stream())
+
+def _tts_or_error(item):
+    text, lang_code = item
     try:
-        tts = gTTS(text=text, lang=lang_code)
-        # Use io.BytesIO instead of tempfile for better Streamlit compatibility
-        mp3_fp = io.BytesIO()
-        tts.write_to_fp(mp3_fp)
-        mp3_fp.seek(0)
-        audio_bytes = mp3_fp.read()
-        b64 = base64.b64encode(audio_bytes).decode()
-        return f'<audio controls src="data:audio/mp3;base64,{b64}"></audio>'
+        return generate_tts_audio(text, lang_code), None
     except Exception as e:
-        log(f"TTS generation failed for {lang_code}: {e}")
-        return f"<i>Audio unavailable: {e}</i>"
-
+        return None, e
+
+def _generate_all_tts(items):
+    # Each gTTS call is an HTTPS round-trip; fetch them all at once so N clips cost ~1 RTT
+    # Identical (text, lang) pairs (e.g. a one-language blend equal to its translation) are fetched once
+    items = list(dict.fromkeys(items))
+    if not items:
+        return {}
+    results = list(_get_executor().map(_tts_or_error, items))
+    audio_map = {}
+    for (text, lang_code), (audio_bytes, err) in zip(items, results):
+        if err is not None:
+            # Logged here rather than in the worker: session state is only reachable from the script thread
+            log(f"TTS generation failed for {lang_code}: {err}")
+        audio_map[(text, lang_code)] = audio_bytes
+    return audio_map
+
+def render_audio(audio_bytes):
+    if audio_bytes:
+        st.audio(audio_bytes, format="audio/mp3")
+    else:
+        st.caption("Audio unavailable (see logs).")
+
+_INDIC_LANGS = {
+    'hi': ('hin-Deva', 'devanagari'),
+    'ta': ('tam-Taml', 'tamil'),
+    'te': ('tel-Telu', 'telugu'),
+    'kn': ('kan-Knda', 'kannada'),
+    'ml': ('mal-Mlym', 'malayalam'),
+    'bn': ('ben-Beng', 'bengali'),
+    'gu': ('guj-Gujr', 'gujarati'),
+    'pa': ('pan-Guru', 'gurmukhi')
+}
+
+_NON_ALNUM_RE = re.compile(r"[^a-zA-Z0-9\s]")
+
+@st.cache_resource(show_spinner=False)
+def _get_epitran(epi_code):
+    # epitran (and panphon under it) takes ~0.7s to import, so it loads on the first Indic pronunciation, not at startup.
+    # The table itself is built once per language per process; that runs on the pronunciation worker, overlapping TTS.
+    import epitran
+    return epitran.Epitran(epi_code)
+
+@st.cache_resource(show_spinner="Loading pronunciation dictionary...")
+def _warm():
+    # Load CMUdict once per process, before any worker thread calls into pronouncing.
+    pronouncing.init_cmu()
+    return True
+
+@st.cache_data(ttl=24 * 60 * 60, max_entries=512, show_spinner=False)
 def get_pronunciation(text, lang_code, simplified=False):
     lang_code = lang_code.lower()
-    indic_langs = {
-        'hi': ('hin-Deva', 'devanagari'),
-        'ta': ('tam-Taml', 'tamil'),
-        'te': ('tel-Telu', 'telugu'),
-        'kn': ('kan-Knda', 'kannada'),
-        'ml': ('mal-Mlym', 'malayalam'),
-        'bn': ('ben-Beng', 'bengali'),
-        'gu': ('guj-Gujr', 'gujarati'),
-        'pa': ('pan-Guru', 'gurmukhi')
-    }
 
-    if lang_code in indic_langs:
-        epi_code, script = indic_langs[lang_code]
-        try:
-            epi = epitran.Epitran(epi_code)
-            ipa_text = epi.transliterate(text)
-        except Exception:
-            ipa_text = None
+    if lang_code in _INDIC_LANGS:
+        from indic_transliteration.sanscript import transliterate
+        epi_code, script = _INDIC_LANGS[lang_code]
+        # The simplified guide never uses the Epitran IPA, so skip it entirely there
         if simplified:
             try:
                 return transliterate(text, script, 'iast')
             except Exception:
                 return text
+        try:
+            epi = _get_epitran(epi_code)
+            ipa_text = epi.transliterate(text)
+        except Exception:
+            ipa_text = None
         return ipa_text if ipa_text else transliterate(text, script, 'iast')
 
     # Heuristic for non-supported languages
-    ipa = text
-    ipa = ipa.replace("th", "θ").replace("sh", "ʃ").replace("ch", "tʃ").replace("ph", "f")
-    ipa = ipa.replace("a", "ɑ").replace("e", "ɛ").replace("i", "i").replace("o", "ɔ").replace("u", "u")
     if simplified:
-        return re.sub(r"[^a-zA-Z0-9\s]", "", text)
-    return ipa
+        return _NON_ALNUM_RE.sub("", text)
+    # Chained str.replace beats a regex/translate pass here: absent needles are a fast C find
+    ipa = text.replace("th", "θ").replace("sh", "ʃ").replace("ch", "tʃ").replace("ph", "f")
+    return ipa.replace("a", "ɑ").replace("e", "ɛ").replace("o", "ɔ")
+
+def _get_pronunciations(items, simplified):
+    return [get_pronunciation(text, code, simplified=simplified) for text, code in items]
 
 # ------------------------
 # Main App UI & Processing
 # ------------------------
+LANGUAGES = {
+    "Spanish": "es", "Kannada": "kn", "Tamil": "ta", "Malayalam": "ml", "Hindi": "hi",
+    "Telugu": "te", "Japanese": "ja", "French": "fr", "Portuguese": "pt",
+    "German": "de", "Korean": "ko"
+}
+LANG_NAMES = list(LANGUAGES)
+
 def main():
     st.title("")  # no duplicate title printed here (we use header above)
 
     # --- INPUT CONTROLS ---
-    col1, col2 = st.columns([2, 1])
-    with col1:
-        lyric_line = st.text_area("Enter your lyric line (English):", height=100, placeholder="e.g., You're my sunshine 🌞")
-    with col2:
-        available_languages = {
-            "Spanish": "es", "Kannada": "kn", "Tamil": "ta", "Malayalam": "ml", "Hindi": "hi",
-            "Telugu": "te", "Japanese": "ja", "French": "fr", "Portuguese": "pt",
-            "German": "de", "Korean": "ko"
-        }
-        selected = st.multiselect("Select 2+ target languages:", list(available_languages.keys()), default=["Spanish", "Hindi"])
-        mode = st.selectbox("Blending mode:", ["Interleave Words", "Phrase Swap", "Last-Word Swap"])
-        # Removed all toggles and kept only the logic to drive the code
-        enhance_rhythm = True # Defaulted to True as it was the default and one of the core features
+    # Inside a form, typing or picking languages doesn't rerun the app; the pipeline only sees new inputs on submit.
+    # Form widgets keep their submitted values, so other reruns (e.g. the pronunciation checkbox) still render the last result.
+    with st.form("melo"):
+        col1, col2 = st.columns([2, 1])
+        with col1:
+            lyric_line = st.text_area("Enter your lyric line (English):", height=100, placeholder="e.g., You're my sunshine 🌞")
+        with col2:
+            selected = st.multiselect("Select 2+ target languages:", LANG_NAMES, default=["Spanish", "Hindi"])
+            mode = st.selectbox("Blending mode:", ["Interleave Words", "Phrase Swap", "Last-Word Swap"])
+            # Removed all toggles and kept only the logic to drive the code
+            enhance_rhythm = True # Defaulted to True as it was the default and one of the core features
+        st.form_submit_button("Blend")
 
     if not lyric_line or not selected:
-        st.info("Enter a lyric and select at least one target language to begin.")
+        st.info("Enter a lyric, select at least one target language and press Blend to begin.")
         with st.sidebar:
             st.subheader("Logs")
-            st.text_area("Logs", value=st.session_state.get("melosphere_logs", ""), height=300)
+            st.text_area("Logs", value=log_text(), height=300)
         return
 
-    # --- PROCESSING (NO LOGIC CHANGE) ---
+    # The landing page never touches CMUdict or the Translate credentials, so both load on the first real run.
+    # The client is built here, on the script thread, so its init log lands in this session; workers only get cache hits.
+    _warm()
+    get_translate_client()
+
+    # --- PROCESSING ---
     lyric_line_clean = clean_text(lyric_line)
-    tgt_codes = [available_languages[l] for l in selected]
+    tgt_codes = [LANGUAGES[l] for l in selected]
     translations_clean, translations_enhanced, overall_stats = {}, {}, {}
+    failed_langs = set()
 
-    def translate_and_enhance(lang_name, code):
-        trans = translate_text(lyric_line_clean, code)
-        # Using fixed max_fillers=3 as per original logic
-        enhanced, orig_syll, trans_before, trans_after, diff = \
-            rhythmic_translation_enhancement(lyric_line_clean, trans, max_fillers=3)
-        return (lang_name, code, trans, enhanced, orig_syll, trans_before, trans_after, diff)
-
-    with ThreadPoolExecutor(max_workers=min(8, len(tgt_codes))) as executor:
-        futures = [executor.submit(translate_and_enhance, lang_name, code) for lang_name, code in zip(selected, tgt_codes)]
-        for fut in as_completed(futures):
-            try:
-                lang_name, code, trans, enhanced, orig_syll, trans_before, trans_after, diff = fut.result()
+    # --- TABBED UI OUTPUTS ---
+    # Tabs are laid out before processing so each translation card can be filled in as soon as it arrives
+    tab_blend, tab_trans, tab_pron, tab_chart = st.tabs(
+        ["Blended Lyric", "Translations & Rhythm", "Pronunciation Guide", "Syllable Charts"]
+    )
+    with tab_trans:
+        st.markdown('<span class="output-header">Detailed Translations and Rhythmic Analysis</span>', unsafe_allow_html=True)
+        trans_slots = {lang_name: col.empty() for col, lang_name in zip(st.columns(len(selected)), selected)}
+
+    # The source line is the same for every language, so count it once
+    lyric_syll = count_syllables_general(lyric_line_clean, "en")
+    # Every selected language sharing a code gets that code's single result
+    names_by_code = {}
+    for code, lang_name in zip(tgt_codes, selected):
+        names_by_code.setdefault(code, []).append(lang_name)
+    with st.spinner("Translating..."):
+        for code, trans, failed in iter_translations_parallel(lyric_line_clean, tgt_codes):
+            # Using fixed max_fillers=3 as per original logic
+            enhanced, orig_syll, trans_before, trans_after, diff = \
+                rhythmic_translation_enhancement(lyric_line_clean, trans, max_fillers=3, orig_syll=lyric_syll)
+            for lang_name in names_by_code[code]:
+                if failed:
+                    failed_langs.add(lang_name)
                 translations_clean[lang_name] = trans
                 translations_enhanced[lang_name] = enhanced
                 overall_stats[lang_name] = {
@@ -592,24 +720,38 @@ def main():
                     "code": code
                 }
                 log(f"Translated: {lang_name} ({code}) — before:{trans_before}, after:{trans_after}, diff:{diff}")
-            except Exception as e:
-                log(f"Translation future failed: {e}")
+
+                # 2. TRANSLATIONS & RHYTHM TAB (one card per language, rendered on arrival)
+                with trans_slots[lang_name].container():
+                    # Custom box style applied via CSS for this section
+                    st.markdown(f"**{lang_name} ({code})**")
+                    st.write(trans)
+
+                    # Syllable/Rhythm info
+                    st.caption(f"**Rhythmically Enhanced:** {enhanced}")
+                    syllable_text = f"Syllables: **Original:** {orig_syll}, **Clean:** {trans_before}, **Enhanced:** {trans_after}"
+                    st.caption(syllable_text)
 
     translations_list_for_blend = [translations_enhanced[name] for name in selected]
     if mode == "Interleave Words":
-        blended = interleave_words(lyric_line_clean, translations_list_for_blend)
+        blended_tokens = interleave_words(lyric_line_clean, translations_list_for_blend)
     elif mode == "Phrase Swap":
-        blended = phrase_swap(lyric_line_clean, translations_list_for_blend)
+        blended_tokens = phrase_swap(lyric_line_clean, translations_list_for_blend)
     else:
-        blended = last_word_swap(lyric_line_clean, translations_list_for_blend)
-    blended = remove_consecutive_duplicates(blended)
+        blended_tokens = last_word_swap(lyric_line_clean, translations_list_for_blend)
+    first_lang_code = LANGUAGES[selected[0]]
+    blended = finalize(blended_tokens)
+    # Languages whose translation failed hold error text; none of it is sent to TTS or transliterated
+    pron_langs = [l for l in selected if l not in failed_langs]
+    pron_items = [(translations_clean[l], LANGUAGES[l]) for l in pron_langs]
+    # The checkbox lives in the pronunciation tab; its keyed state is already set when this rerun starts
+    show_simple = st.session_state.get("show_simple", False)
+    # Transliteration runs while the TTS clips download instead of after them
+    pron_future = _get_executor().submit(_get_pronunciations, pron_items, show_simple)
+    audio_map = _generate_all_tts([(blended, first_lang_code)] + pron_items)
+    prons = dict(zip(pron_langs, pron_future.result()))
     # --- END PROCESSING ---
 
-    # --- TABBED UI OUTPUTS ---
-    tab_blend, tab_trans, tab_pron, tab_chart = st.tabs(
-        ["Blended Lyric", "Translations & Rhythm", "Pronunciation Guide", "Syllable Charts"]
-    )
-
     # 1. BLENDED LYRIC TAB
     with tab_blend:
         st.markdown('<span class="output-header">Final Blended Lyric</span>', unsafe_allow_html=True)
@@ -618,44 +760,27 @@ def main():
 
         # Audio for the blended line
         st.markdown(f"**Listen to the Blended Line (First selected language: {selected[0]})**")
-        first_lang_code = available_languages[selected[0]]
-        # Wrapped audio in a div with styling for dark mode appearance
-        st.markdown(f'<div class="stAudio">{generate_tts_audio(blended, first_lang_code)}</div>', unsafe_allow_html=True)
-
-
-    # 2. TRANSLATIONS & RHYTHM TAB
-    with tab_trans:
-        st.markdown('<span class="output-header">Detailed Translations and Rhythmic Analysis</span>', unsafe_allow_html=True)
-        trans_cols = st.columns(len(selected))
-        for col, lang_name in zip(trans_cols, selected):
-            with col:
-                code = available_languages[lang_name]
-                stats = overall_stats.get(lang_name, {})
-
-                # Custom box style applied via CSS for this section
-                st.markdown(f"**{lang_name} ({code})**")
-                st.write(translations_clean.get(lang_name, ""))
-
-                # Syllable/Rhythm info
-                st.caption(f"**Rhythmically Enhanced:** {translations_enhanced.get(lang_name, '')}")
-                syllable_text = f"Syllables: **Original:** {stats.get('orig_syll')}, **Clean:** {stats.get('trans_before')}, **Enhanced:** {stats.get('trans_after')}"
-                st.caption(syllable_text)
+        # st.audio renders with the .stAudio class, so the dark-mode styling still applies
+        render_audio(audio_map[(blended, first_lang_code)])
 
     # 3. PRONUNCIATION GUIDE TAB
     with tab_pron:
         st.markdown('<span class="output-header">Phonetic Guide and Audio Examples</span>', unsafe_allow_html=True)
         # Retained a single checkbox for phonetic style choice
-        show_simple = st.checkbox("Show Simplified Transliteration (e.g., IAST) instead of IPA", value=False)
+        show_simple = st.checkbox("Show Simplified Transliteration (e.g., IAST) instead of IPA", value=False, key="show_simple")
 
         for lang_name in selected:
-            code = available_languages[lang_name]
+            code = LANGUAGES[lang_name]
             text = translations_clean[lang_name]
 
             st.markdown("---")
             st.markdown(f"#### {lang_name} ({code})")
+            if lang_name in failed_langs:
+                st.caption("Translation failed, so there is no pronunciation or audio (see logs).")
+                continue
 
             # Pronunciation
-            pron = get_pronunciation(text, code, simplified=show_simple)
+            pron = prons[lang_name]
             st.markdown(f"**{'Simplified' if show_simple else 'IPA/Extended'} Transliteration:**")
             if isinstance(pron, str):
                 st.markdown(f'```\n{pron}\n```')
@@ -664,22 +789,22 @@ def main():
 
             # Audio Player
             st.markdown(f"**Audio Playback:**")
-            st.markdown(f'<div class="stAudio">{generate_tts_audio(text, code)}</div>', unsafe_allow_html=True)
+            render_audio(audio_map[(text, code)])
 
     # 4. SYLLABLE CHARTS TAB
     with tab_chart:
         st.markdown('<span class="output-header">Rhythm Match Visualization</span>', unsafe_allow_html=True)
-        chart_cols = st.columns(len(selected))
-        for col, lang_name in zip(chart_cols, selected):
-            with col:
-                stats = overall_stats[lang_name]
-                fig = plot_syllable_comparison(stats["orig_syll"], stats["trans_before"], stats["trans_after"], lang_name)
-                st.plotly_chart(fig, use_container_width=True)
+        st.markdown("**Syllable Count Comparison**")
+        df = syllable_comparison_frame(overall_stats)
+        if (df.nunique(axis=1) == 1).all():
+            st.caption("Every translation already matches the original syllable count.")
+        else:
+            st.bar_chart(df, height=360, stack=False, color=["#9aa0b4", "#5ad1ff", "#7c5cff"])
 
     # Sidebar logs (remains unchanged)
     with st.sidebar:
         st.subheader("Logs")
-        st.text_area("Runtime logs:", value=st.session_state.get("melosphere_logs", ""), height=300)
+        st.text_area("Runtime logs:", value=log_text(), height=300)
 
 if __name__ == "__main__":
     main()